@@ -55,6 +55,8 @@ class Editor(object):
     """
     _getter_prefix = 'parse'
     _fmt = '{0}: {1}\n'.format   # Format for printing lines (see __repr__)
+    _constants_regex = re.compile('{{[A-z0-9]}}')    # Escaped brackets (see variables)
+    _variables_regex = re.compile('{[A-z0-9]*}')     # Template variables (see variables)
 
     @property
     def log(self):
@@ -270,10 +272,11 @@ class Editor(object):
         keys_only = kwargs.pop("keys_only", False)
         flags = kwargs.pop("flags", 0)
         results = {pattern: [] for pattern in patterns}
+        compiled = [(pattern, re.compile(pattern, flags)) for pattern in patterns]
         stop = stop if stop is not None else -1
         for i, line in enumerate(self[start:stop]):
-            for pattern in patterns:
-                grps = re.search(pattern, line, flags=flags)
+            for pattern, regex in compiled:
+                grps = regex.search(line)
                 if grps and keys_only:
                     results[pattern].append(i)
                 elif grps and grps.groups():
@@ -343,8 +346,8 @@ class Editor(object):
         .. _string formatting: https://docs.python.org/3.6/library/string.html
         """
         string = str(self)
-        constants = [match[1:-1] for match in re.findall('{{[A-z0-9]}}', string)]
-        variables = re.findall('{[A-z0-9]*}', string)
+        constants = [match[1:-1] for match in self._constants_regex.findall(string)]
+        variables = self._variables_regex.findall(string)
         return sorted(set(variables).difference(constants))
 
     @classmethod
@@ -396,8 +396,6 @@ def check_key(data_object, key, cardinal=False):
         key = [key]
     elif isinstance(key, slice):
         key = list(sorted(data_object.index.values[key]))
-    elif isinstance(key, (tuple, list, pd.Index)) and not np.all(k in keys for k in key):
-        key = list(sorted(data_object.index.values[key]))
     return key
 
 
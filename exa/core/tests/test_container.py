@@ -5,7 +5,6 @@
 Tests for :mod:`~exa.core.container`
 #######################################
 """
-import six
 import pandas as pd
 from unittest import TestCase
 from exa import Container, TypedMeta, DataFrame, Series
@@ -29,7 +28,7 @@ class DummyMeta(TypedMeta):
     df = DummyDataFrame
 
 
-class DummyContainer(six.with_metaclass(DummyMeta, Container)):
+class DummyContainer(Container, metaclass=DummyMeta):
     pass
 
 
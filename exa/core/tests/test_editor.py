@@ -6,33 +6,41 @@ Tests for :mod:`~exa.core.editor`
 ##################################
 """
 import os, six
+from copy import copy
 from unittest import TestCase
 from exa import Editor
 
 
 class TestEditor(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
         Generate the file path to the exa.core.editor module (which will be used as
         the test for the :class:`~exa.core.editor.Editor` class that it provides).
+        The file is only read once for all tests.
         """
-        self.path = os.path.abspath(os.path.join(os.path.abspath(__file__), "../../editor.py"))
-        with open(self.path) as f:
-            self.lines = f.readlines()
-        self.fl = Editor.from_file(self.path)
+        cls.path = os.path.abspath(os.path.join(os.path.abspath(__file__), "../../editor.py"))
+        with open(cls.path) as f:
+            cls.text = f.read()
+        cls.lines = cls.text.splitlines()
+        cls._fl = Editor.from_file(cls.path)
+
+    def setUp(self):
+        """Give each test its own copy of the editor (tests modify lines)."""
+        self.fl = copy(self._fl)
+        self.fl._lines = list(self._fl._lines)
 
     def test_loaders(self):
         """
         The editor provides there different methods for instantiation; from a
         file on disk, from a file stream, or from a string.
         """
-        fl = Editor.from_file(self.path)
+        fl = self.fl    # Created by Editor.from_file (see setUpClass)
         with open(self.path) as f:
             tm = Editor.from_stream(f)
-            f.seek(0)
-            tr = Editor.from_string(f.read())
+        tr = Editor.from_string(self.text)
         self.assertTrue(len(self.lines) == len(fl) == len(tm) == len(tr))
-        self.assertTrue(all(fl[i] == tm[i] == tr[i] for i in range(len(self.lines))))
+        self.assertTrue(fl._lines == tm._lines == tr._lines)
 
     def test_find_regex(self):
         od = self.fl.find('Args:')
@@ -6,7 +6,6 @@ Tests for Strong Typing
 ########################
 See :mod:`~exa.typed` for more details on how typing works.
 """
-import six
 import pytest
 from itertools import product
 from exa.typed import Typed, typed, TypedClass, TypedMeta, yield_typed
@@ -27,7 +26,7 @@ class Simple2(TypedClass):
         self.foo = foo
 
 
-class Simple3(six.with_metaclass(TypedMeta, Simple1)):
+class Simple3(Simple1, metaclass=TypedMeta):
     pass
 
 
@@ -251,7 +251,7 @@ class TypedMeta(type):
 
     .. code-block:: Python
 
-        class Foo(six.with_metaclass(TypedMeta, object)):
+        class Foo(metaclass=TypedMeta):
             bar = Typed(int, doc="Always an int")
 
     See Also:
@@ -262,7 +262,7 @@ class TypedMeta(type):
         return super(TypedMeta, mcs).__new__(mcs, name, bases, namespace)
 
 
-class TypedClass(six.with_metaclass(TypedMeta, object)):
+class TypedClass(metaclass=TypedMeta):
     """
     A mixin class which can be used to create a class with strongly typed
     attributes.
@@ -92,6 +92,10 @@ class Isotope(object):
         from exa.util import isotopes
         isotopes.U['235'].mass    # Mass of 235-U
     """
+    # Isotopes are numerous and have a fixed set of attributes (see _columns)
+    __slots__ = ("A", "Z", "af", "afu", "cov_radius", "van_radius", "g", "mass",
+                 "massu", "name", "eneg", "quad", "spin", "symbol", "color")
+
     @property
     def radius(self):
         return self.cov_radius
@@ -113,56 +117,66 @@ class Isotope(object):
         self.symbol = symbol
         self.color = color
 
-    @property
-    def radius(self):
-        return self.cov_radius
-
     def __repr__(self):
         return str(self.A) + self.symbol
 
 
 def _create():
     """Globally called function for creating the isotope/element API."""
-    def creator(group):
-        """Helper function applied to each symbol group of the raw isotope table."""
-        symbol = group['symbol'].values[0]
-        try:    # Ghosts and custom atoms don't necessarily have an abundance fraction
-            mass = (group['mass']*group['af']).sum()
-            afm = group['af'].sum()
-            if afm > 0.0:
-                mass /= afm
-        except ZeroDivisionError:
-            mass = group['mass'].mean()
-        znum = group['Z'].max()
-        cov_radius = group['cov_radius'].mean()
-        van_radius = group['van_radius'].mean()
-        try:
-            color = group.loc[group['af'].idxmax(), 'color']
-        except TypeError:
-            color = group['color'].values[0]
-        name = group['name'].values[0]
-        ele = Element(symbol, name, mass, znum, cov_radius, van_radius, color)
-        # Attached isotopes
-        for tope in group.apply(lambda s: Isotope(*s.tolist()), axis=1):
-            setattr(ele, "_"+str(tope.A), tope)
-        return ele
-
+    global _frame
     iso = _rj(_E(_path).to_stream())
     iso.columns = _columns
     setattr(_this, "iso", iso)
-    for element in iso.groupby("symbol").apply(creator):
-        setattr(_this, element.symbol, element)
+    # Seed the as_df cache from the raw table (in as_df's symbol order)
+    _frame = _DF(iso.sort_values("symbol", kind="mergesort").reset_index(drop=True))
+    # Element properties are aggregated over each symbol's isotopes; ghosts
+    # and custom atoms don't necessarily have an abundance fraction.
+    grps = iso.groupby("symbol")
+    afm = grps['af'].sum()
+    mass = (iso['mass']*iso['af']).groupby(iso['symbol']).sum()
+    mass /= afm.where(afm > 0.0, 1.0)
+    znum = grps['Z'].max()
+    cov_radius = grps['cov_radius'].mean()
+    van_radius = grps['van_radius'].mean()
+    name = grps['name'].first()
+    # Color of the most abundant isotope (if known)
+    color = grps['color'].first()
+    abund = iso.dropna(subset=['af'])
+    color.update(abund.loc[abund.groupby("symbol")['af'].idxmax()].set_index("symbol")['color'])
+    for symbol in znum.index:
+        ele = Element(symbol, name[symbol], mass[symbol], znum[symbol],
+                      cov_radius[symbol], van_radius[symbol], color[symbol])
+        setattr(_this, symbol, ele)
+    # Attached isotopes
+    for row in iso.itertuples(index=False):
+        tope = Isotope(*row)
+        setattr(getattr(_this, tope.symbol), "_"+str(tope.A), tope)
 
 
 def as_df():
-    """Return a dataframe of isotopes."""
-    records = []
-    for sym, ele in vars(_this).items():
-        if sym not in ["Element", "Isotope"] and not sym.startswith("_"):
-            for k, v in vars(ele).items():
-                if k.startswith("_") and k[1].isdigit():
-                    records.append({kk: vv for kk, vv in vars(v).items() if not kk.startswith("_")})
-    return _DF.from_records(records)
+    """
+    Return a dataframe of isotopes.
+
+    The dataframe is built once and cached; a copy is returned so that callers
+    may modify it freely. Call :func:`~exa.util.isotopes.clear_cache` after
+    modifying element or isotope attributes to rebuild it.
+    """
+    global _frame
+    if _frame is None:
+        records = []
+        for sym, ele in vars(_this).items():
+            if sym not in ["Element", "Isotope"] and not sym.startswith("_"):
+                for k, v in vars(ele).items():
+                    if k.startswith("_") and k[1].isdigit():
+                        records.append({kk: getattr(v, kk) for kk in v.__slots__})
+        _frame = _DF.from_records(records)
+    return _frame.copy()
+
+
+def clear_cache():
+    """Discard the cached isotope dataframe (see :func:`~exa.util.isotopes.as_df`)."""
+    global _frame
+    _frame = None
 
 
 # Data order of isotopic (nuclear) properties:
@@ -170,6 +184,7 @@ _resource = "../../static/isotopes.json"    # HARDCODED
 _columns = ("A", "Z", "af", "afu", "cov_radius", "van_radius", "g", "mass", "massu", "name",
             "eneg", "quad", "spin", "symbol", "color")
 _this = _sys.modules[__name__]         # Reference to this module
+_frame = None                          # Cached result of as_df
 _path = _os.path.abspath(_os.path.join(_os.path.abspath(__file__), _resource))
 if not hasattr(_this, "H"):
     _create()
@@ -31,3 +31,13 @@ class TestIsotopes(TestCase):
         self.assertGreater(isotopes.H['1'].mass, 1.007)
         self.assertGreater(isotopes.H['1'].radius, 0.6)
 
+    def test_as_df_cache(self):
+        """Test that the cached isotope table is not modified by callers."""
+        self.addCleanup(setattr, isotopes, "_frame", isotopes._frame)
+        iso = isotopes.as_df()
+        n = len(iso)
+        iso.drop(iso.index, inplace=True)
+        seeded = isotopes.as_df()
+        self.assertEqual(len(seeded), n)
+        isotopes.clear_cache()
+        self.assertTrue(isotopes.as_df().equals(seeded))
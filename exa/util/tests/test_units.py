@@ -25,3 +25,15 @@ def test_units():
     assert np.isclose(units.Length['au', 'Angstrom'], 0.52918)
     assert np.isclose(units.Length['Angstrom'], 1E-10)
 
+
+def test_base_cache():
+    """Check that lookups follow changes to the base unit."""
+    unit = units.Unit({"a": 1.0, "b": 2.0}, "test")
+    assert np.isclose(unit["b"], 0.5)
+    unit["a"] = 4.0
+    unit["b"] = 1.0
+    assert np.isclose(unit["a"], 0.25)
+    values = unit.values
+    values["a"] = 1.0
+    values["b"] = 4.0
+    assert np.isclose(unit["b"], 0.25)
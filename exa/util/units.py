@@ -33,10 +33,14 @@ class Unit(object):
 
     def __setitem__(self, key, value):
         self._values[key] = value
+        self._base = None
 
     def __getitem__(self, key):
         if isinstance(key, _six.string_types):
-            k = self._values[_np.isclose(self._values, 1.0)].index[0]
+            k = self._base    # Key of the base (SI) unit, cached
+            if k is None or not _np.isclose(self._values[k], 1.0):
+                k = self._values[_np.isclose(self._values, 1.0)].index[0]
+                self._base = k
             return self._values[k]/self._values[key]
         elif isinstance(key, (list, tuple)):
             return self._values[key[1]]/self._values[key[0]]
@@ -44,6 +48,7 @@ class Unit(object):
     def __init__(self, values, name):
         self._values = _pd.Series(values)
         self._name = name
+        self._base = None
 
 
 def _create():
@@ -34,6 +34,7 @@ setup_args = {
     'package_data': {name: [staticdir + "/*"]},
     'include_package_data': True,
     'install_requires': dependencies,
+    'python_requires': ">=3.5",
     'packages': find_packages(),
     'zip_safe': False,
     'license': "Apache License Version 2.0",
@@ -49,7 +50,6 @@ setup_args = {
         "Intended Audience :: Developers",
         "Intended Audience :: Science/Research",
         "License :: OSI Approved :: Apache Software License",
-        "Programming Language :: Python :: 2",
         "Programming Language :: Python :: 3",
         "Natural Language :: English"
     ]